@@ -0,0 +1,45 @@
+import pytest
+
+
+CELLS = ((0, 0), (20, 0), (40, 0), (60, 0))
+
+
+@pytest.fixture
+def free_cells(_the_snake):
+    return _the_snake.FreeCells(CELLS)
+
+
+def assert_consistent(free_cells, expected):
+    assert sorted(free_cells.cells) == sorted(expected), (
+        'Убедитесь, что `FreeCells.cells` содержит ровно свободные клетки.'
+    )
+    assert len(free_cells) == len(expected)
+    assert free_cells.indexes == {
+        position: index for index, position in enumerate(free_cells.cells)
+    }, (
+        'Убедитесь, что `FreeCells.indexes` хранит индекс каждой клетки '
+        'в `FreeCells.cells`.'
+    )
+
+
+@pytest.mark.parametrize(
+    'position',
+    (CELLS[-1], CELLS[1], (100, 100)),
+    ids=('last', 'middle', 'missing')
+)
+def test_free_cells_discard(free_cells, position):
+    free_cells.discard(position)
+    assert_consistent(free_cells, set(CELLS) - {position})
+
+
+def test_free_cells_add_is_idempotent(free_cells):
+    free_cells.discard(CELLS[0])
+    free_cells.add(CELLS[0])
+    free_cells.add(CELLS[0])
+    assert_consistent(free_cells, CELLS)
+
+
+def test_free_cells_choice(free_cells):
+    for position in CELLS[1:]:
+        free_cells.discard(position)
+    assert free_cells.choice() == CELLS[0]
@@ -0,0 +1,51 @@
+from collections import deque
+
+import pytest
+
+
+@pytest.fixture
+def snake_on_board(monkeypatch, _the_snake):
+    monkeypatch.setattr(
+        _the_snake, 'FREE_CELLS', _the_snake.FreeCells(_the_snake.ALL_CELLS)
+    )
+
+    def place(positions, direction):
+        snake = _the_snake.Snake()
+        snake.positions = deque(positions)
+        snake.occupied = set(positions)
+        snake.direction = direction
+        return snake
+    return place
+
+
+@pytest.mark.parametrize(
+    'positions, collided',
+    (
+        (((40, 0), (20, 0), (0, 0)), False),
+        (((20, 0), (0, 0), (0, 20), (20, 20)), False),
+        (((20, 0), (0, 0), (0, 20), (20, 20), (40, 20)), True),
+    ),
+    ids=('free_cell', 'tail_chasing', 'body')
+)
+def test_snake_move(_the_snake, snake_on_board, positions, collided):
+    snake = snake_on_board(positions, _the_snake.DOWN)
+    snake.move()
+    assert snake.positions[0] == (positions[0][0], 20)
+    assert snake.collided is collided, (
+        'Убедитесь, что метод `move` отмечает столкновение змейки с собой, '
+        'но не с клеткой, которую только что освободил хвост.'
+    )
+    assert snake.occupied == set(snake.positions)
+    assert len(snake.positions) == len(positions)
+
+
+def test_snake_grow(_the_snake, snake_on_board):
+    positions = ((40, 0), (20, 0), (0, 0))
+    snake = snake_on_board(positions, _the_snake.RIGHT)
+    snake.move()
+    snake.grow()
+    assert list(snake.positions) == [(60, 0), *positions], (
+        'Убедитесь, что при росте змейка сохраняет хвост, '
+        'отброшенный при движении.'
+    )
+    assert snake.occupied == set(snake.positions)
@@ -1,6 +1,6 @@
 import pygame as pg
 
-from abc import abstractmethod
+from collections import deque
 from random import choice
 
 # Константы для размеров поля и сетки:
@@ -9,10 +9,15 @@ GRID_SIZE = 20
 GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE
 
-UP = (0, -1)
-DOWN = (0, 1)
-LEFT = (-1, 0)
-RIGHT = (1, 0)
+# Направления движения - сразу шаг в пикселях:
+UP = (0, -GRID_SIZE)
+DOWN = (0, GRID_SIZE)
+LEFT = (-GRID_SIZE, 0)
+RIGHT = (GRID_SIZE, 0)
+
+# Переход через границу поля на противоположную сторону:
+WRAP_X = {-GRID_SIZE: SCREEN_WIDTH - GRID_SIZE, SCREEN_WIDTH: 0}
+WRAP_Y = {-GRID_SIZE: SCREEN_HEIGHT - GRID_SIZE, SCREEN_HEIGHT: 0}
 
 BOARD_BACKGROUND_COLOR = (189, 188, 183)
 BORDER_COLOR = (93, 216, 228)
@@ -41,13 +46,93 @@ SPEED_MAPPING_KEY = {
     pg.K_z: -1
 }
 
+
+def make_cell(body_color: tuple, with_border: bool = True) -> pg.Surface:
+    """
+    Render the cell of the given color once to blit it later.
+    :param body_color: color of the cell
+    :param with_border: whether to draw the border of the cell
+    :return: surface with the rendered cell.
+    """
+    cell = pg.Surface((GRID_SIZE, GRID_SIZE))
+    cell.fill(body_color)
+    if with_border:
+        pg.draw.rect(cell, BORDER_COLOR, cell.get_rect(), 1)
+    return cell
+
+
+CELL_SURFACES = {
+    SNAKE_COLOR: make_cell(SNAKE_COLOR),
+    APPLE_COLOR: make_cell(APPLE_COLOR),
+    POISON_COLOR: make_cell(POISON_COLOR),
+    BOARD_BACKGROUND_COLOR: make_cell(
+        BOARD_BACKGROUND_COLOR, with_border=False
+    )
+}
+
 speed = 10
 
+dirty_cells = {}
+dirty_rects = []
+
 screen = pg.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
 clock = pg.time.Clock()
 
 
+class FreeCells:
+    """Free cells of the game board with O(1) random choice."""
+
+    def __init__(self, cells: set = frozenset()) -> None:
+        self.cells = []
+        self.indexes = {}
+        self.update(cells)
+
+    def __len__(self) -> int:
+        """Get the number of free cells."""
+        return len(self.cells)
+
+    def add(self, position: tuple) -> None:
+        """
+        Mark the cell as free.
+        :param position: position of the cell
+        """
+        if position not in self.indexes:
+            self.indexes[position] = len(self.cells)
+            self.cells.append(position)
+
+    def discard(self, position: tuple) -> None:
+        """
+        Mark the cell as used, moving the last free cell into its place.
+        :param position: position of the cell
+        """
+        index = self.indexes.pop(position, None)
+        if index is None:
+            return
+        last_position = self.cells.pop()
+        if index < len(self.cells):
+            self.cells[index] = last_position
+            self.indexes[last_position] = index
+
+    def update(self, cells: set) -> None:
+        """
+        Mark the cells as free.
+        :param cells: positions of the cells
+        """
+        for position in cells:
+            self.add(position)
+
+    def choice(self) -> tuple:
+        """
+        Get a random free cell.
+        :return: position of the cell.
+        """
+        return choice(self.cells)
+
+
+FREE_CELLS = FreeCells(ALL_CELLS)
+
+
 class GameObject:
     """Base class for game objects."""
 
@@ -57,17 +142,12 @@ class GameObject:
 
     def draw_cell(self, position: tuple, body_color: tuple = None) -> None:
         """
-        Draw the cell on the screen.
+        Mark the cell to be drawn on the screen at the end of the frame.
         :param position: position of the cell
         :param body_color: color of the cell
         """
-        body_color = body_color or self.body_color
-        rect = pg.Rect(position, (GRID_SIZE, GRID_SIZE))
-        pg.draw.rect(screen, body_color, rect)
-        if body_color != BOARD_BACKGROUND_COLOR:
-            pg.draw.rect(screen, BORDER_COLOR, rect, 1)
+        dirty_cells[position] = body_color or self.body_color
 
-    @abstractmethod
     def draw(self) -> None:
         """Draw the object on the screen."""
 
@@ -75,17 +155,19 @@ class GameObject:
 class Apple(GameObject):
     """Class representing an apple on the game board."""
 
-    def __init__(self, used_cells: tuple = (),
-                 body_color: tuple = APPLE_COLOR) -> None:
+    def __init__(self, body_color: tuple = APPLE_COLOR) -> None:
         super().__init__(body_color=body_color)
-        self.randomize_position(used_cells)
+        self.randomize_position()
 
-    def randomize_position(self, used_cells: tuple) -> None:
-        """
-        Randomly generate a position for the item on the game board.
-        :param used_cells: Used cells.
-        """
-        self.position = choice(tuple(ALL_CELLS - set(used_cells)))
+    def randomize_position(self) -> None:
+        """Randomly generate a position for the item on the game board."""
+        self.position = FREE_CELLS.choice()
+        FREE_CELLS.discard(self.position)
+
+    def remove(self) -> None:
+        """Remove the item from its cell before moving it."""
+        self.draw_cell(self.position, BOARD_BACKGROUND_COLOR)
+        FREE_CELLS.add(self.position)
 
     def draw(self):
         """Draw the object on the screen."""
@@ -95,10 +177,8 @@ class Apple(GameObject):
 class Poison(Apple):
     """Class representing a poison on the game board."""
 
-    def __init__(self, used_cells: tuple,
-                 body_color: tuple = POISON_COLOR) -> None:
-        super().__init__(used_cells, body_color=body_color)
-        self.randomize_position(used_cells)
+    def __init__(self, body_color: tuple = POISON_COLOR) -> None:
+        super().__init__(body_color=body_color)
 
 
 class Snake(GameObject):
@@ -106,6 +186,7 @@ class Snake(GameObject):
 
     def __init__(self, body_color: tuple = SNAKE_COLOR) -> None:
         super().__init__(body_color)
+        self.positions = []
         self.reset()
 
     def update_direction(self, direction: tuple) -> None:
@@ -116,43 +197,85 @@ class Snake(GameObject):
         self.direction = direction
 
     def move(self) -> None:
-        """Move the snake forward in its current direction."""
-        new_head_position = self.get_head_position(self.direction)
-        self.positions.insert(0, new_head_position)
+        """
+        Move the snake forward in its current direction.
+        Sets the collided flag if the new head hits the snake's body.
+        """
+        new_head_position = self.next_head(*self.direction)
         self.last = self.positions.pop()
+        self.occupied.discard(self.last)
+        FREE_CELLS.add(self.last)
+        self.collided = new_head_position in self.occupied
+        self.positions.appendleft(new_head_position)
+        self.occupied.add(new_head_position)
+        FREE_CELLS.discard(new_head_position)
+
+    def grow(self) -> None:
+        """Grow the snake by keeping the tail dropped on the last move."""
+        self.positions.append(self.last)
+        self.occupied.add(self.last)
+        FREE_CELLS.discard(self.last)
+        # Хвост остаётся на месте - перерисовать нужно только голову.
+        self.last = self.positions[0]
+        self.max_length = max(len(self.positions), self.max_length)
+
+    def shrink(self) -> tuple[int, int]:
+        """
+        Remove the snake's tail.
+        :return: position of the removed tail.
+        """
+        tail = self.positions.pop()
+        self.occupied.discard(tail)
+        FREE_CELLS.add(tail)
+        return tail
 
     def draw(self) -> None:
         """Draw the object on the screen."""
-        self.draw_cell(self.get_head_position())
-        if self.last:
-            self.draw_cell(self.last, BOARD_BACKGROUND_COLOR)
+        self.draw_cell(self.last, BOARD_BACKGROUND_COLOR)
+        self.draw_cell(self.positions[0])
+
+    def erase(self) -> None:
+        """Erase the snake from the screen."""
+        for position in self.positions:
+            self.draw_cell(position, BOARD_BACKGROUND_COLOR)
+        self.draw_cell(self.last, BOARD_BACKGROUND_COLOR)
 
-    def get_head_position(self, direction: tuple = None) -> tuple[int, int]:
+    def get_head_position(self) -> tuple[int, int]:
         """
         Get the position of the snake's head.
-        :param direction: New direction to consider
-        when calculating the head position.
         :return: tuple of x and y coordinates of the snake's head.
         """
-        if not direction:
-            return self.positions[0]
+        return self.positions[0]
+
+    def next_head(self, direction_x: int, direction_y: int) -> tuple[int, int]:
+        """
+        Get the position of the snake's head after the move.
+        :param direction_x: Step of the move along the x axis.
+        :param direction_y: Step of the move along the y axis.
+        :return: tuple of x and y coordinates of the new head.
+        """
         current_x_pos, current_y_pos = self.positions[0]
-        direction_x, direction_y = direction
+        new_x_pos = current_x_pos + direction_x
+        new_y_pos = current_y_pos + direction_y
         return (
-            (current_x_pos + direction_x * GRID_SIZE) % SCREEN_WIDTH,
-            (current_y_pos + direction_y * GRID_SIZE) % SCREEN_HEIGHT
+            WRAP_X.get(new_x_pos, new_x_pos),
+            WRAP_Y.get(new_y_pos, new_y_pos)
         )
 
-    def reset(self) -> None:
-        """Reset the snake."""
+    def reset(self, keep_max_length: bool = False) -> None:
+        """
+        Reset the snake.
+        :param keep_max_length: Keep the reached maximum length.
+        """
+        FREE_CELLS.update(self.positions)
         self.direction = RIGHT
-        self.positions = [self.position]
-        self.last = None
-        self.max_length = 1
-
-    def calculate_max_length(self) -> None:
-        """Calculate the length of the snake."""
-        self.max_length = max(len(self.positions), self.max_length)
+        self.positions = deque([self.position])
+        self.occupied = set(self.positions)
+        FREE_CELLS.discard(self.position)
+        self.collided = False
+        self.last = self.position
+        if not keep_max_length:
+            self.max_length = 1
 
 
 def change_speed(value: int) -> None:
@@ -175,30 +298,61 @@ def update_display_caption(max_length: int) -> None:
         f'Выход - ESC.')
 
 
+def update_display() -> None:
+    """Draw the marked cells and update the changed parts of the display."""
+    for position, body_color in dirty_cells.items():
+        dirty_rects.append(screen.blit(CELL_SURFACES[body_color], position))
+    pg.display.update(dirty_rects)
+    dirty_cells.clear()
+    dirty_rects.clear()
+
+
+def quit_game() -> None:
+    """Quit the game."""
+    pg.quit()
+    raise SystemExit
+
+
+def handle_keydown(event: pg.event.Event, game_object: Snake) -> None:
+    """
+    Handle the key press: quit, change speed or turn the game object.
+    :param event: Key press event.
+    :param game_object: Game object to control.
+    """
+    handler = KEY_HANDLERS.get(event.key)
+    if handler:
+        handler(event)
+    else:
+        game_object.update_direction(
+            DIRECTION_MAPPING_KEY.get(
+                (event.key, game_object.direction),
+                game_object.direction
+            )
+        )
+
+
+KEY_HANDLERS = {
+    pg.K_ESCAPE: lambda event: quit_game(),
+    **dict.fromkeys(
+        SPEED_MAPPING_KEY,
+        lambda event: change_speed(SPEED_MAPPING_KEY[event.key])
+    )
+}
+EVENT_HANDLERS = {
+    pg.QUIT: lambda event, game_object: quit_game(),
+    pg.KEYDOWN: handle_keydown
+}
+
+
 def handle_keys(game_object: Snake):
     """
     Handle keyboard input to control the game object.
     :param game_object: Game object to control.
     """
     for event in pg.event.get():
-        if event.type == pg.QUIT:
-            pg.quit()
-            raise SystemExit
-        if event.type == pg.KEYDOWN:
-            if event.key == pg.K_ESCAPE:
-                pg.quit()
-                raise SystemExit
-            if event.key in SPEED_MAPPING_KEY:
-                change_speed(
-                    SPEED_MAPPING_KEY.get(event.key)
-                )
-            else:
-                game_object.update_direction(
-                    DIRECTION_MAPPING_KEY.get(
-                        (event.key, game_object.direction),
-                        game_object.direction
-                    )
-                )
+        EVENT_HANDLERS.get(
+            event.type, lambda event, game_object: None
+        )(event, game_object)
 
 
 def main():
@@ -207,45 +361,48 @@ def main():
     Starts the game loop and handles key inputs.
     """
     pg.init()
-    screen.fill(BOARD_BACKGROUND_COLOR)
+    dirty_rects.append(screen.fill(BOARD_BACKGROUND_COLOR))
 
+    FREE_CELLS.update(ALL_CELLS)
     snake = Snake()
-    apple = Apple(snake.positions)
-    poison = Poison((*snake.positions, apple.position))
+    apple = Apple()
+    poison = Poison()
 
     while True:
         handle_keys(snake)
         snake.move()
 
-        snake_head_position = snake.get_head_position()
+        snake_head_position = snake.positions[0]
 
-        if snake_head_position in snake.positions[1:]:
+        if snake.collided:
+            apple.remove()
+            poison.remove()
+            snake.erase()
             snake.reset()
-            snake.calculate_max_length()
-            apple.randomize_position(snake.positions)
-            poison.randomize_position((*snake.positions, apple.position))
-            screen.fill(color=BOARD_BACKGROUND_COLOR)
+            apple.randomize_position()
+            poison.randomize_position()
         elif snake_head_position == apple.position:
-            snake.positions.insert(0, snake.get_head_position())
-            snake.calculate_max_length()
-            apple.randomize_position(snake.positions)
-            poison.draw_cell(poison.position, BOARD_BACKGROUND_COLOR)
-            poison.randomize_position((*snake.positions, apple.position))
+            snake.grow()
+            poison.remove()
+            if len(FREE_CELLS) < 2:
+                # Для яблока и яда не осталось места - победа,
+                # в заголовке остаётся победная длина.
+                snake.erase()
+                snake.reset(keep_max_length=True)
+            apple.randomize_position()
+            poison.randomize_position()
         elif snake_head_position == poison.position:
             if len(snake.positions) > 1:
-                snake.draw_cell(
-                    snake.positions.pop(), BOARD_BACKGROUND_COLOR
-                )
-                snake.calculate_max_length()
-            apple.draw_cell(apple.position, BOARD_BACKGROUND_COLOR)
-            apple.randomize_position(snake.positions)
-            poison.randomize_position((*snake.positions, apple.position))
+                snake.draw_cell(snake.shrink(), BOARD_BACKGROUND_COLOR)
+            apple.remove()
+            apple.randomize_position()
+            poison.randomize_position()
 
         snake.draw()
         apple.draw()
         poison.draw()
 
-        pg.display.update()
+        update_display()
         update_display_caption(snake.max_length)
 
         clock.tick(speed)